@@ -28,7 +28,8 @@ MODEL_CONFIG = {
     },
     "max_features": 20000,
     "max_length": 100,
-    "confidence_threshold": 0.5
+    "confidence_threshold": 0.5,
+    "quantize": True  # Serve dynamically quantized INT8 weights when ONNX Runtime is used
 }
 
 # Toxicity Categories
@@ -61,9 +62,10 @@ UI_CONFIG = {
     "warning_color": "#F39C12",
     "error_color": "#E74C3C",
     "chart_colors": [
-        "#FF6B6B", "#4ECDC4", "#45B7D1", 
+        "#FF6B6B", "#4ECDC4", "#45B7D1",
         "#96CEB4", "#FFEAA7", "#DDA0DD"
-    ]
+    ],
+    "use_plotly": False  # False: render with Streamlit's built-in Vega-Lite (smaller JS payload)
 }
 
 # Example Texts for Testing
@@ -127,6 +129,12 @@ PERFORMANCE_CONFIG = {
     "cache_ttl": 3600,  # 1 hour
     "max_text_length": 5000,
     "batch_size": 32,
+    "max_batch_size": 32,        # Upper bound for micro-batched inference
+    "batch_timeout_micros": 10000,  # How long the batcher waits to fill a batch (10 ms)
+    "num_batch_threads": 1,
+    "intra_op_threads": None,    # None: half the logical cores
+    "inter_op_threads": 1,
+    "predict_sla_seconds": 2.0,  # Latency bound before the lexicon fallback answers
     "enable_gpu": False,
     "memory_limit": "1GB"
 }
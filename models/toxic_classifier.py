@@ -6,17 +6,63 @@ Handles model loading, prediction, and text classification with modern ML practi
 
 import os
 import pickle
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 import numpy as np
+import logging
+
+from config.config import MODEL_CONFIG, PERFORMANCE_CONFIG
+
+# Thread pool sizes must be fixed before TensorFlow initializes: unbounded
+# defaults (one thread per logical core) cause context-switch thrash on
+# small cloud instances
+_INTRA_THREADS = PERFORMANCE_CONFIG.get("intra_op_threads") or max(1, (os.cpu_count() or 2) // 2)
+_INTER_THREADS = PERFORMANCE_CONFIG.get("inter_op_threads") or 1
+os.environ.setdefault("OMP_NUM_THREADS", str(_INTRA_THREADS))
+os.environ.setdefault("TF_NUM_INTRAOP_THREADS", str(_INTRA_THREADS))
+os.environ.setdefault("TF_NUM_INTEROP_THREADS", str(_INTER_THREADS))
+
 import tensorflow as tf
 from tensorflow import keras
 from tensorflow.keras.models import model_from_json
-from tensorflow.keras.preprocessing.sequence import pad_sequences
-import logging
+
+try:
+    tf.config.threading.set_intra_op_parallelism_threads(_INTRA_THREADS)
+    tf.config.threading.set_inter_op_parallelism_threads(_INTER_THREADS)
+except RuntimeError:
+    # TensorFlow was already initialized by an earlier import; the
+    # environment variables above still apply where possible
+    pass
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Pre-compiled token pattern for the inline tokenization hot path
+_WORD_RE = re.compile(r"\w+")
+
+# Keyword lexicon for the fast heuristic fallback used when model
+# inference exceeds its latency SLA
+_TOXIC_LEXICON = frozenset([
+    'hate', 'stupid', 'idiot', 'idiots', 'dumb', 'moron', 'morons',
+    'kill', 'die', 'ugly', 'trash', 'loser', 'losers', 'disgusting',
+    'pathetic', 'worthless', 'shut', 'scum'
+])
+
+class InferenceTimeout(TimeoutError):
+    """
+    Raised when model inference exceeds its latency SLA. Carries the
+    lexicon-heuristic score vector so callers can show a degraded answer
+    without memoizing it as if the model had produced it.
+    """
+
+    def __init__(self, scores):
+        super().__init__("model inference exceeded its latency SLA")
+        self.scores = scores
+
 class ToxicClassifier:
     """
     Modern toxic comment classifier with improved error handling and performance.
@@ -32,19 +78,123 @@ class ToxicClassifier:
         self.model_path = model_path
         self.model = None
         self.tokenizer = None
+        self._infer = None
+        self._sess = None
+        self._fast_tok = None
+        self._nb_vocab = None
+        # Per-thread reusable padding buffer (thread-local so concurrent
+        # sessions cannot overwrite each other's rows)
+        self._pad_local = threading.local()
         self.max_features = 20000
         self.max_len = 100
         self.categories = ['toxic', 'severe_toxic', 'obscene', 'threat', 'insult', 'identity_hate']
+        # Deterministic fallback scores: keeps degraded responses cheap and
+        # cache-friendly (random values would defeat memoization upstream)
+        self._zero_preds = {category: 0.0 for category in self.categories}
+
+        # Micro-batching configuration (TF Serving style shared batcher)
+        self.max_batch_size = PERFORMANCE_CONFIG.get("max_batch_size", 32)
+        self.batch_timeout = PERFORMANCE_CONFIG.get("batch_timeout_micros", 10000) / 1e6
+        self.num_batch_threads = PERFORMANCE_CONFIG.get("num_batch_threads", 1)
 
         # Load model and tokenizer
         self._load_model()
         self._load_tokenizer()
 
+        # Start background batching workers that coalesce concurrent
+        # single-text requests into one model call
+        self._queue = queue.Queue()
+        self._batch_threads = []
+        for _ in range(self.num_batch_threads):
+            worker = threading.Thread(target=self._batch_worker, daemon=True)
+            worker.start()
+            self._batch_threads.append(worker)
+
+    def _batch_worker(self):
+        """
+        Background worker that drains queued requests into a single batched
+        model call. Waits up to `batch_timeout` seconds to coalesce up to
+        `max_batch_size` concurrent requests, then scatters the prediction
+        rows back to each caller's future.
+        """
+        while True:
+            row, future = self._queue.get()
+            rows = [row]
+            futures = [future]
+
+            # Coalesce additional requests until the batch fills or times out
+            deadline = time.monotonic() + self.batch_timeout
+            while len(rows) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row, future = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                rows.append(row)
+                futures.append(future)
+
+            batch = np.stack(rows)
+
+            try:
+                predictions = self._run_inference(batch)
+            except Exception as e:
+                for f in futures:
+                    f.set_exception(e)
+                continue
+
+            for f, prediction_row in zip(futures, predictions):
+                f.set_result(prediction_row)
+
+    def _run_inference(self, batch):
+        """
+        Run an (N, max_len) batch through the fastest available backend:
+        the ONNX session, then the traced tf.function, then a direct call.
+
+        Args:
+            batch (np.ndarray): Batch of padded token id rows
+
+        Returns:
+            np.ndarray: Prediction matrix of shape (N, num_categories)
+        """
+        if self._sess is not None:
+            batch = batch.astype(self._sess_dtype, copy=False)
+            return self._sess.run(None, {self._sess_input_name: batch})[0]
+
+        if self._infer is not None:
+            batch = batch.astype(self._infer_dtype.as_numpy_dtype, copy=False)
+            return self._infer(tf.constant(batch)).numpy()
+
+        # Direct call skips the Keras predict/Dataset wrapper overhead
+        return self.model(batch, training=False).numpy()
+
     def _load_model(self):
         """Load the trained model from JSON and weights files."""
         try:
             model_json_path = os.path.join(self.model_path, 'model.json')
             weights_path = os.path.join(self.model_path, 'weights.h5')
+            cached_model_path = os.path.join(self.model_path, 'model.keras')
+            saved_model_dir = os.path.join(self.model_path, 'saved_model')
+
+            # Fastest cold start: a SavedModel loads in one shot and its
+            # serving signature is already a graph-mode callable, with no
+            # Keras layer deserialization at all
+            if os.path.isdir(saved_model_dir) and self._load_saved_model(saved_model_dir):
+                self._load_onnx_session()
+                logger.info("Model loaded from SavedModel serving signature")
+                return
+
+            # Prefer the single-file cache saved on a previous start: one
+            # read, no JSON graph parsing or separate weight copying
+            if os.path.exists(cached_model_path):
+                self.model = keras.models.load_model(cached_model_path, compile=False)
+
+                self._build_infer_fn()
+                self._load_onnx_session()
+
+                logger.info("Model loaded from cached model.keras")
+                return
 
             if not os.path.exists(model_json_path):
                 logger.error(f"Model JSON file not found at {model_json_path}")
@@ -63,19 +213,88 @@ class ToxicClassifier:
             # Load weights
             self.model.load_weights(weights_path)
 
-            # Compile model
-            self.model.compile(
-                loss='binary_crossentropy',
-                optimizer='adam',
-                metrics=['accuracy']
-            )
+            # No compile: inference never needs a loss or optimizer, and
+            # Adam slots alone would double the weight memory
+
+            # Cache as a single file so later starts skip the JSON parse
+            try:
+                self.model.save(cached_model_path)
+            except Exception as e:
+                logger.warning(f"Could not cache model.keras: {str(e)}")
+
+            # Also export a SavedModel so later starts can bypass Keras
+            # deserialization entirely
+            try:
+                self.model.export(saved_model_dir)
+            except Exception as e:
+                logger.warning(f"Could not export SavedModel: {str(e)}")
+
+            self._build_infer_fn()
+            self._load_onnx_session()
 
             logger.info("Model loaded successfully")
 
         except Exception as e:
             logger.error(f"Error loading model: {str(e)}")
-            # Create a dummy model for demo purposes if real model fails
-            self._create_dummy_model()
+            # Defer the dummy fallback to the first predict call so a
+            # missing model does not slow down app startup
+            self.model = None
+
+    def _load_saved_model(self, saved_model_dir):
+        """
+        Load the serving_default concrete function from a SavedModel
+        export. Leaves self.model unset; inference runs through the
+        signature callable.
+
+        Returns:
+            bool: True if the serving signature was loaded
+        """
+        try:
+            loaded = tf.saved_model.load(saved_model_dir)
+            serving_fn = loaded.signatures["serving_default"]
+
+            output_key = list(serving_fn.structured_outputs.keys())[0]
+            input_specs = tf.nest.flatten(serving_fn.structured_input_signature[1])
+            self._infer_dtype = input_specs[0].dtype
+
+            # Keep a reference to the loaded object so its variables stay alive
+            self._saved_model = loaded
+            self._infer = lambda x: serving_fn(x)[output_key]
+
+            # Warm-up call so the first user request skips graph setup
+            self._infer(tf.zeros((1, self.max_len), dtype=self._infer_dtype))
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to load SavedModel signature: {str(e)}")
+            self._infer = None
+            return False
+
+    def _build_infer_fn(self):
+        """
+        Trace the forward pass once as a tf.function with a fixed input
+        signature, so per-request calls skip Keras predict overhead and
+        re-tracing. A warm-up call at build time pays the tracing cost
+        up front instead of on the first user request.
+        """
+        try:
+            input_dtype = self.model.inputs[0].dtype
+        except Exception:
+            input_dtype = "int32"
+        self._infer_dtype = tf.as_dtype(input_dtype)
+
+        infer = tf.function(
+            lambda x: self.model(x, training=False),
+            input_signature=[tf.TensorSpec([None, self.max_len], self._infer_dtype)]
+        )
+
+        try:
+            # Warm-up call to trigger tracing now
+            infer(tf.zeros((1, self.max_len), dtype=self._infer_dtype))
+            self._infer = infer
+        except Exception as e:
+            logger.warning(f"Model warm-up failed, falling back to direct calls: {str(e)}")
+            self._infer = None
 
     def _create_dummy_model(self):
         """Create a dummy model for demonstration purposes when real model fails."""
@@ -89,11 +308,62 @@ class ToxicClassifier:
             keras.layers.Dense(6, activation='sigmoid')  # 6 toxicity categories
         ])
 
-        self.model.compile(
-            loss='binary_crossentropy',
-            optimizer='adam',
-            metrics=['accuracy']
-        )
+        self._build_infer_fn()
+
+    def _load_onnx_session(self):
+        """
+        Convert the loaded Keras model to ONNX once (cached on disk) and
+        serve it with ONNX Runtime for faster CPU inference. Skipped when
+        tf2onnx or onnxruntime are not installed; inference then stays on
+        the TensorFlow path.
+        """
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            logger.info("onnxruntime not available, using TensorFlow inference")
+            return
+
+        try:
+            onnx_path = os.path.join(self.model_path, 'model.onnx')
+
+            if not os.path.exists(onnx_path):
+                if self.model is None:
+                    # Nothing to convert from (serving via SavedModel signature)
+                    return
+                import tf2onnx
+                tf2onnx.convert.from_keras(self.model, opset=17, output_path=onnx_path)
+
+            # Dynamic INT8 quantization: smaller weights and faster dense
+            # kernels on CPU; thresholded classification absorbs the noise
+            if MODEL_CONFIG.get("quantize", False):
+                int8_path = os.path.join(self.model_path, 'model.int8.onnx')
+                try:
+                    if not os.path.exists(int8_path):
+                        from onnxruntime.quantization import quantize_dynamic, QuantType
+                        quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QInt8)
+                    onnx_path = int8_path
+                except Exception as e:
+                    logger.warning(f"INT8 quantization failed, using FP32 model: {str(e)}")
+
+            sess_options = ort.SessionOptions()
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            sess_options.intra_op_num_threads = _INTRA_THREADS
+            sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+
+            self._sess = ort.InferenceSession(
+                onnx_path,
+                sess_options=sess_options,
+                providers=["CPUExecutionProvider"]
+            )
+            session_input = self._sess.get_inputs()[0]
+            self._sess_input_name = session_input.name
+            self._sess_dtype = np.float32 if 'float' in session_input.type else np.int32
+
+            logger.info("ONNX Runtime session initialized")
+
+        except Exception as e:
+            logger.warning(f"ONNX conversion failed, using TensorFlow inference: {str(e)}")
+            self._sess = None
 
     def _load_tokenizer(self):
         """Load the tokenizer from pickle file."""
@@ -103,14 +373,86 @@ class ToxicClassifier:
             if os.path.exists(tokenizer_path):
                 with open(tokenizer_path, 'rb') as handle:
                     self.tokenizer = pickle.load(handle)
+                self._cache_vocab()
                 logger.info("Tokenizer loaded successfully")
             else:
-                logger.warning("Tokenizer file not found, creating dummy tokenizer")
-                self._create_dummy_tokenizer()
+                logger.warning("Tokenizer file not found, deferring dummy tokenizer")
+                self.tokenizer = None
 
         except Exception as e:
             logger.error(f"Error loading tokenizer: {str(e)}")
+            self.tokenizer = None
+
+    def _ensure_ready(self):
+        """
+        Build the dummy fallbacks on first use. Keeps cold start fast when
+        model resources are missing; the app can render immediately and
+        only pays for the dummy construction if a prediction is requested.
+        """
+        if self.tokenizer is None:
             self._create_dummy_tokenizer()
+        if self.model is None and self._infer is None and self._sess is None:
+            self._create_dummy_model()
+
+    def _cache_vocab(self):
+        """Cache the tokenizer vocabulary for the inline lookup hot path."""
+        self._word_index = self.tokenizer.word_index
+        self._oov = self._word_index.get("<OOV>", 1)
+        self._build_fast_tokenizer()
+        self._build_numba_vocab()
+
+    def _build_numba_vocab(self):
+        """
+        Convert the vocabulary into a numba typed Dict so the encode loop
+        can run as native code. Optional; skipped when numba is missing.
+        """
+        self._nb_vocab = None
+        try:
+            from utils._tokenize_nb import NUMBA_AVAILABLE, build_vocab
+            if NUMBA_AVAILABLE:
+                self._nb_vocab = build_vocab(self._word_index, self.max_features)
+                logger.info("Numba tokenization kernel initialized")
+        except Exception as e:
+            logger.warning(f"Failed to build numba vocab: {str(e)}")
+
+    def _build_fast_tokenizer(self):
+        """
+        Build a Rust-backed WordLevel tokenizer from the cached vocabulary.
+        Used for the tokenization hot path when the `tokenizers` package is
+        installed; otherwise the inline Python lookup is used.
+        """
+        try:
+            from tokenizers import Regex, Tokenizer as FastTokenizer
+            from tokenizers.models import WordLevel
+            from tokenizers.normalizers import Lowercase
+            from tokenizers.pre_tokenizers import Split
+        except ImportError:
+            logger.info("tokenizers package not available, using inline tokenization")
+            self._fast_tok = None
+            return
+
+        try:
+            # Keep only in-vocabulary ids; everything else maps to OOV,
+            # matching the num_words filtering of the Keras tokenizer
+            vocab = {word: idx for word, idx in self._word_index.items()
+                     if idx < self.max_features}
+            vocab.setdefault("<OOV>", self._oov)
+
+            fast_tok = FastTokenizer(WordLevel(vocab, unk_token="<OOV>"))
+            fast_tok.normalizer = Lowercase()
+            # Extract \w+ runs as tokens, exactly like the inline fallback:
+            # a Whitespace pre-tokenizer would emit punctuation runs as
+            # extra OOV tokens that the other backends never produce
+            fast_tok.pre_tokenizer = Split(Regex(r"\w+"), behavior="removed", invert=True)
+            fast_tok.enable_padding(direction="left", length=self.max_len, pad_id=0)
+            fast_tok.enable_truncation(self.max_len, direction="left")
+
+            self._fast_tok = fast_tok
+            logger.info("Fast tokenizer initialized")
+
+        except Exception as e:
+            logger.warning(f"Failed to build fast tokenizer: {str(e)}")
+            self._fast_tok = None
 
     def _create_dummy_tokenizer(self):
         """Create a dummy tokenizer for demonstration."""
@@ -127,69 +469,163 @@ class ToxicClassifier:
             "clean good content"
         ]
         self.tokenizer.fit_on_texts(sample_texts)
+        self._cache_vocab()
 
-    def preprocess_text(self, text):
+    def _get_pad_buf(self):
+        """Return the calling thread's reusable (1, max_len) int32 buffer."""
+        buf = getattr(self._pad_local, 'buf', None)
+        if buf is None:
+            buf = np.zeros((1, self.max_len), dtype=np.int32)
+            self._pad_local.buf = buf
+        return buf
+
+    def preprocess_text(self, text, already_clean=False):
         """
         Preprocess input text for prediction.
 
         Args:
             text (str): Input text to preprocess
+            already_clean (bool): Skip normalization for text that has
+                already been lowercased and stripped by the caller
 
         Returns:
-            np.ndarray: Preprocessed text ready for model input
+            np.ndarray: Preprocessed text ready for model input. May be a
+                reused per-thread buffer; copy it before the next call on
+                the same thread if it needs to be retained.
         """
+        self._ensure_ready()
+
         if not isinstance(text, str):
             text = str(text)
 
         # Convert to lowercase and basic cleaning
-        text = text.lower().strip()
-
-        # Tokenize text
-        text_array = np.array([text]).reshape(1,)
-        list_tokenized_text = self.tokenizer.texts_to_sequences(text_array)
-
-        # Pad sequences
-        x_text = pad_sequences(list_tokenized_text, maxlen=self.max_len)
+        if not already_clean:
+            text = text.lower().strip()
+
+        # Rust tokenizer hot path: normalization, lookup, padding and
+        # truncation all happen outside the GIL
+        if self._fast_tok is not None:
+            ids = self._fast_tok.encode(text).ids
+            return np.asarray(ids, dtype=np.int32)[None, :]
+
+        # Inline tokenization: look tokens up in the cached vocabulary and
+        # write them left-padded into the reusable output buffer, mirroring
+        # the texts_to_sequences + pad_sequences defaults without the Python
+        # tokenizer loop or per-call allocations
+        x_text = self._get_pad_buf()
+        x_text.fill(0)
+        tokens = _WORD_RE.findall(text)[-self.max_len:]
+
+        # JIT-compiled encode loop when numba is available
+        if self._nb_vocab is not None and tokens:
+            from utils._tokenize_nb import encode, to_typed_list
+            encode(to_typed_list(tokens), self._nb_vocab, x_text[0], self.max_len, self._oov)
+            return x_text
+
+        word_index = self._word_index
+        oov = self._oov
+        max_features = self.max_features
+        offset = self.max_len - len(tokens)
+        for i, token in enumerate(tokens):
+            idx = word_index.get(token, oov)
+            x_text[0, offset + i] = idx if idx < max_features else oov
 
         return x_text
 
-    def predict(self, text):
+    def predict(self, text, skip_preprocess=False, pre_tokenized=None):
         """
         Predict toxicity categories for input text.
 
         Args:
             text (str): Input text to analyze
+            skip_preprocess (bool): Treat the input as already normalized
+                (e.g. cleaned by utils.text_preprocessing.preprocess_text)
+            pre_tokenized (np.ndarray, optional): Already tokenized and
+                padded (1, max_len) input; skips tokenization entirely
 
         Returns:
             dict: Dictionary with category names as keys and probabilities as values
         """
+        probs = self.predict_array(text, skip_preprocess=skip_preprocess,
+                                   pre_tokenized=pre_tokenized)
+
+        # Convert to dictionary
+        result = {}
+        for i, category in enumerate(self.categories):
+            result[category] = float(probs[i])
+
+        return result
+
+    def _lexicon_predict(self, text):
+        """
+        Fast keyword heuristic used when model inference exceeds its SLA.
+        Flags general toxicity only, so the caller still gets a bounded
+        answer instead of a stalled spinner.
+        """
+        words = set(_WORD_RE.findall(text.lower()))
+        scores = np.zeros(len(self.categories), dtype=np.float32)
+        if not words.isdisjoint(_TOXIC_LEXICON):
+            scores[self.categories.index('toxic')] = 0.8
+        return scores
+
+    def predict_array(self, text, skip_preprocess=False, pre_tokenized=None, sla=None):
+        """
+        Predict toxicity categories and return the raw score vector.
+
+        Args:
+            text (str): Input text to analyze
+            skip_preprocess (bool): Treat the input as already normalized
+            pre_tokenized (np.ndarray, optional): Already tokenized and
+                padded (1, max_len) input; skips tokenization entirely
+            sla (float, optional): Latency bound in seconds; if inference
+                takes longer, InferenceTimeout is raised with the fast
+                lexicon heuristic's scores attached
+
+        Returns:
+            np.ndarray: Score vector of shape (num_categories,), suitable
+                for vectorized thresholding downstream
+
+        Raises:
+            InferenceTimeout: Inference exceeded `sla`; .scores holds the
+                degraded heuristic vector, which callers must not cache
+        """
         if not text or not text.strip():
-            return {category: 0.0 for category in self.categories}
+            return np.zeros(len(self.categories), dtype=np.float32)
+
+        self._ensure_ready()
 
         try:
-            # Preprocess text
-            processed_text = self.preprocess_text(text)
+            # Preprocess text (unless the caller supplied token ids)
+            if pre_tokenized is not None:
+                processed_text = np.asarray(pre_tokenized, dtype=np.int32).reshape(1, self.max_len)
+            else:
+                processed_text = self.preprocess_text(text, already_clean=skip_preprocess)
 
             # Make prediction
-            if self.model is None:
-                # Return dummy predictions if model is not loaded
+            if self.model is None and self._infer is None and self._sess is None:
+                # Return constant dummy predictions if no backend is loaded
                 logger.warning("Model not loaded, returning dummy predictions")
-                import random
-                return {category: random.uniform(0.1, 0.9) for category in self.categories}
-
-            predictions = self.model.predict(processed_text, verbose=0)
-
-            # Convert to dictionary
-            result = {}
-            for i, category in enumerate(self.categories):
-                result[category] = float(predictions[0][i])
-
-            return result
+                return np.zeros(len(self.categories), dtype=np.float32)
 
+            # Enqueue for the batching worker and wait for our row
+            future = Future()
+            self._queue.put((processed_text[0], future))
+            try:
+                return np.asarray(future.result(timeout=sla))
+            except FutureTimeoutError:
+                # Straggler mitigation: answer within the SLA from the
+                # cheap heuristic; the stale future is simply abandoned.
+                # Raised rather than returned so callers can keep the
+                # degraded scores out of their caches
+                logger.warning(f"Inference exceeded SLA of {sla}s, using lexicon fallback")
+                raise InferenceTimeout(self._lexicon_predict(text))
+
+        except InferenceTimeout:
+            raise
         except Exception as e:
             logger.error(f"Error during prediction: {str(e)}")
             # Return safe dummy predictions on error
-            return {category: 0.1 for category in self.categories}
+            return np.full(len(self.categories), 0.1, dtype=np.float32)
 
     def batch_predict(self, texts):
         """
@@ -201,10 +637,44 @@ class ToxicClassifier:
         Returns:
             list: List of prediction dictionaries
         """
-        results = []
-        for text in texts:
-            result = self.predict(text)
-            results.append(result)
+        results = [None] * len(texts)
+
+        # Separate out empty inputs, which keep all-zero scores
+        pending = []
+        for i, text in enumerate(texts):
+            if text is None or not str(text).strip():
+                results[i] = dict(self._zero_preds)
+            else:
+                pending.append((i, str(text).lower().strip()))
+
+        if not pending:
+            return results
+
+        self._ensure_ready()
+
+        try:
+            # Tokenize and pad all pending texts, then run one model call
+            if self._fast_tok is not None:
+                encodings = self._fast_tok.encode_batch([text for _, text in pending])
+                batch = np.asarray([encoding.ids for encoding in encodings], dtype=np.int32)
+            else:
+                # Copy each row out of the reusable preprocessing buffer
+                batch = np.zeros((len(pending), self.max_len), dtype=np.int32)
+                for j, (_, text) in enumerate(pending):
+                    batch[j] = self.preprocess_text(text, already_clean=True)[0]
+
+            predictions = self._run_inference(batch)
+
+            for (i, _), row in zip(pending, predictions):
+                results[i] = {category: float(score)
+                              for category, score in zip(self.categories, row)}
+
+        except Exception as e:
+            logger.error(f"Error during batch prediction: {str(e)}")
+            # Return safe dummy predictions for the texts that failed
+            for i, _ in pending:
+                results[i] = {category: 0.1 for category in self.categories}
+
         return results
 
     def get_model_info(self):
@@ -218,7 +688,8 @@ class ToxicClassifier:
             "categories": self.categories,
             "max_features": self.max_features,
             "max_length": self.max_len,
-            "model_loaded": self.model is not None,
+            "model_loaded": (self.model is not None or self._infer is not None
+                             or self._sess is not None),
             "tokenizer_loaded": self.tokenizer is not None
         }
 
@@ -6,12 +6,16 @@ Unit tests for the Toxic Comment Classifier
 import pytest
 import sys
 import os
+import numpy as np
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from models.toxic_classifier import ToxicClassifier, predict
-from utils.text_preprocessing import preprocess_text, basic_clean
+from utils.text_preprocessing import (
+    preprocess_text, basic_clean, basic_clean_batch,
+    extract_features, extract_features_batch
+)
 from config.config import TOXICITY_CATEGORIES
 
 class TestToxicClassifier:
@@ -59,6 +63,29 @@ class TestToxicClassifier:
         assert len(results) == len(self.test_texts)
         assert all(isinstance(result, dict) for result in results)
 
+    def test_preprocess_backend_equivalence(self):
+        """Test that all tokenization backends encode identically"""
+        text = "you are stupid and I hate this!!!"
+        classifier = self.classifier
+        classifier.preprocess_text("warm up")  # builds the tokenizer backends
+
+        fast_tok, nb_vocab = classifier._fast_tok, classifier._nb_vocab
+        encoded = {}
+        try:
+            if fast_tok is not None:
+                encoded['fast'] = classifier.preprocess_text(text).copy()
+            classifier._fast_tok = None
+            if nb_vocab is not None:
+                encoded['numba'] = classifier.preprocess_text(text).copy()
+            classifier._nb_vocab = None
+            encoded['python'] = classifier.preprocess_text(text).copy()
+        finally:
+            classifier._fast_tok, classifier._nb_vocab = fast_tok, nb_vocab
+
+        reference = encoded.pop('python')
+        for backend, ids in encoded.items():
+            assert np.array_equal(ids, reference), backend
+
     def test_legacy_predict_function(self):
         """Test backward compatibility function"""
         pred_list, scores_list, categories_list = predict("Test text")
@@ -86,6 +113,26 @@ class TestTextPreprocessing:
         assert "https://example.com" not in processed
         assert processed == processed.lower()
 
+    def test_basic_clean_batch_matches_single(self):
+        """Test batch cleaning against the single-text version"""
+        texts = [
+            "This is a TEST with CAPS and   extra spaces",
+            "Visit https://example.com for more info!!!",
+            ""
+        ]
+        cleaned = basic_clean_batch(texts)
+
+        assert cleaned == [basic_clean(text) for text in texts]
+
+    def test_extract_features_batch_matches_single(self):
+        """Test batch feature extraction against the single-text version"""
+        texts = ["This is GREAT!!!", "numbers 123 here?", "ÉLÈVE Über 42 naïve!?", ""]
+        batch_features = extract_features_batch(texts)
+
+        assert len(batch_features) == len(texts)
+        for text, features in zip(texts, batch_features):
+            assert features == extract_features(text)
+
     def test_none_input_handling(self):
         """Test handling of None inputs"""
         result = preprocess_text(None)
@@ -0,0 +1,72 @@
+"""
+Numba-Compiled Tokenization Kernel
+==================================
+Optional JIT-compiled encode loop for the classifier's tokenization hot
+path. Falls back gracefully when numba is not installed.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numba
+    from numba import njit, types
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def encode(words, vocab, out, max_len, oov):
+        """
+        Write vocabulary ids for `words` left-padded into `out`.
+
+        Args:
+            words: numba.typed.List of token strings
+            vocab: numba.typed.Dict mapping token -> id (pre-filtered to
+                in-vocabulary ids; misses map to `oov`)
+            out: int32 output row of length `max_len`, zeroed in place
+            max_len (int): Maximum sequence length
+            oov (int): Id assigned to out-of-vocabulary tokens
+
+        Returns:
+            The filled output row
+        """
+        out[:] = 0
+        n = len(words)
+        start = 0 if n <= max_len else n - max_len
+        count = n - start
+        offset = max_len - count
+        for i in range(count):
+            word = words[start + i]
+            if word in vocab:
+                out[offset + i] = vocab[word]
+            else:
+                out[offset + i] = oov
+        return out
+
+    def build_vocab(word_index, max_features):
+        """
+        Convert a tokenizer word_index dict into a numba typed Dict,
+        keeping only ids below `max_features`.
+        """
+        vocab = numba.typed.Dict.empty(types.unicode_type, types.int64)
+        for word, idx in word_index.items():
+            if idx < max_features:
+                vocab[word] = idx
+        return vocab
+
+    def to_typed_list(words):
+        """Convert a Python list of strings into a numba typed List."""
+        typed_words = numba.typed.List.empty_list(types.unicode_type)
+        for word in words:
+            typed_words.append(word)
+        return typed_words
+
+else:
+    encode = None
+    build_vocab = None
+    to_typed_list = None
@@ -5,14 +5,70 @@ Modern visualization functions using Plotly for interactive charts.
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
+from plotly.colors import qualitative
+from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+from collections import Counter
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Deletes word-cloud punctuation in a single C-level pass
+_WORDCLOUD_TRANS = str.maketrans('', '', '.,!?";:()[]{}')
+
+# Display labels for the fixed toxicity category set; the fallback covers
+# any caller-supplied categories outside it
+_CAT_DISPLAY = {
+    'toxic': 'Toxic',
+    'severe_toxic': 'Severe Toxic',
+    'obscene': 'Obscene',
+    'threat': 'Threat',
+    'insult': 'Insult',
+    'identity_hate': 'Identity Hate'
+}
+
+def _display_name(category):
+    """Return the display label for a category without per-call string work."""
+    return _CAT_DISPLAY.get(category) or category.replace('_', ' ').title()
+
+# Shared layout templates, built once; per-call figures copy and patch
+# the title instead of re-declaring every nested layout dict
+_BAR_LAYOUT = dict(
+    xaxis_title="Toxicity Categories",
+    yaxis_title="Confidence Score",
+    yaxis=dict(range=[0, 1], tickformat='.0%'),
+    template="plotly_white",
+    height=400,
+    showlegend=False
+)
+
+_RADAR_LAYOUT = dict(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 1],
+            ticksuffix='',
+            tickformat='.1%'
+        )
+    ),
+    template="plotly_white",
+    height=400,
+    showlegend=False
+)
+
+def _titled_layout(base, title, font_size):
+    """Copy a shared layout template and set the centered title."""
+    layout = dict(base)
+    layout['title'] = {
+        'text': title,
+        'x': 0.5,
+        'xanchor': 'center',
+        'font': {'size': font_size}
+    }
+    return layout
+
 def create_toxicity_chart(predictions, threshold=0.5, title="Toxicity Analysis"):
     """
     Create an interactive bar chart for toxicity predictions.
@@ -26,45 +82,34 @@ def create_toxicity_chart(predictions, threshold=0.5, title="Toxicity Analysis")
         plotly.graph_objects.Figure: Interactive bar chart
     """
     categories = list(predictions.keys())
-    scores = list(predictions.values())
-
-    # Create colors based on threshold
-    colors = ['red' if score >= threshold else 'green' for score in scores]
-
-    fig = go.Figure(data=[
-        go.Bar(
-            x=categories,
-            y=scores,
-            text=[f'{score:.1%}' for score in scores],
-            textposition='auto',
-            marker_color=colors,
-            hovertemplate='<b>%{x}</b><br>Score: %{y:.3f}<extra></extra>'
-        )
-    ])
+    scores = np.fromiter(predictions.values(), dtype=float, count=len(categories))
+
+    # Threshold colors in one vectorized comparison; bar labels are
+    # formatted client-side by the texttemplate instead of per score here
+    colors = np.where(scores >= threshold, 'red', 'green').tolist()
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=categories,
+                y=scores,
+                texttemplate='%{y:.1%}',
+                textposition='auto',
+                marker_color=colors,
+                hovertemplate='<b>%{x}</b><br>Score: %{y:.3f}<extra></extra>'
+            )
+        ],
+        layout=_titled_layout(_BAR_LAYOUT, title, 18)
+    )
 
     # Add threshold line
     fig.add_hline(
-        y=threshold, 
-        line_dash="dash", 
+        y=threshold,
+        line_dash="dash",
         line_color="orange",
         annotation_text=f"Threshold ({threshold:.1%})"
     )
 
-    fig.update_layout(
-        title={
-            'text': title,
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 18}
-        },
-        xaxis_title="Toxicity Categories",
-        yaxis_title="Confidence Score",
-        yaxis=dict(range=[0, 1], tickformat='.0%'),
-        template="plotly_white",
-        height=400,
-        showlegend=False
-    )
-
     return fig
 
 def create_radar_chart(predictions, title="Toxicity Radar Chart"):
@@ -82,9 +127,68 @@ def create_radar_chart(predictions, title="Toxicity Radar Chart"):
     scores = list(predictions.values())
 
     # Format category names for display
-    formatted_categories = [cat.replace('_', ' ').title() for cat in categories]
+    formatted_categories = [_display_name(cat) for cat in categories]
+
+    fig = go.Figure(
+        data=[
+            go.Scatterpolar(
+                r=scores,
+                theta=formatted_categories,
+                fill='toself',
+                name='Toxicity Scores',
+                line_color='rgb(255, 99, 71)',
+                fillcolor='rgba(255, 99, 71, 0.3)',
+                hovertemplate='<b>%{theta}</b><br>Score: %{r:.3f}<extra></extra>'
+            )
+        ],
+        layout=_titled_layout(_RADAR_LAYOUT, title, 16)
+    )
 
-    fig = go.Figure()
+    return fig
+
+def create_analysis_figure(predictions, threshold=0.5, title="Toxicity Analysis"):
+    """
+    Create the bar chart and radar chart as one combined figure.
+
+    Rendering a single figure halves the JSON serialization and websocket
+    payload compared to two separate st.plotly_chart calls.
+
+    Args:
+        predictions (dict): Dictionary with category predictions
+        threshold (float): Threshold for toxicity classification
+        title (str): Figure title
+
+    Returns:
+        plotly.graph_objects.Figure: Combined bar + radar figure
+    """
+    categories = list(predictions.keys())
+    scores = np.fromiter(predictions.values(), dtype=float, count=len(categories))
+    formatted_categories = [_display_name(cat) for cat in categories]
+
+    colors = np.where(scores >= threshold, 'red', 'green').tolist()
+
+    fig = make_subplots(
+        rows=1, cols=2,
+        specs=[[{"type": "xy"}, {"type": "polar"}]],
+        column_widths=[0.55, 0.45]
+    )
+
+    fig.add_trace(go.Bar(
+        x=categories,
+        y=scores,
+        texttemplate='%{y:.1%}',
+        textposition='auto',
+        marker_color=colors,
+        hovertemplate='<b>%{x}</b><br>Score: %{y:.3f}<extra></extra>'
+    ), row=1, col=1)
+
+    fig.add_hline(
+        y=threshold,
+        line_dash="dash",
+        line_color="orange",
+        annotation_text=f"Threshold ({threshold:.1%})",
+        row=1, col=1
+    )
 
     fig.add_trace(go.Scatterpolar(
         r=scores,
@@ -94,9 +198,18 @@ def create_radar_chart(predictions, title="Toxicity Radar Chart"):
         line_color='rgb(255, 99, 71)',
         fillcolor='rgba(255, 99, 71, 0.3)',
         hovertemplate='<b>%{theta}</b><br>Score: %{r:.3f}<extra></extra>'
-    ))
+    ), row=1, col=2)
 
     fig.update_layout(
+        title={
+            'text': title,
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18}
+        },
+        xaxis_title="Toxicity Categories",
+        yaxis_title="Confidence Score",
+        yaxis=dict(range=[0, 1], tickformat='.0%'),
         polar=dict(
             radialaxis=dict(
                 visible=True,
@@ -105,19 +218,52 @@ def create_radar_chart(predictions, title="Toxicity Radar Chart"):
                 tickformat='.1%'
             )
         ),
-        title={
-            'text': title,
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 16}
-        },
         template="plotly_white",
-        height=400,
+        height=450,
         showlegend=False
     )
 
     return fig
 
+def create_toxicity_chart_vega(predictions, threshold=0.5, title="Toxicity Analysis"):
+    """
+    Create the toxicity bar chart as an Altair/Vega-Lite chart.
+
+    Streamlit already ships the Vega runtime, so rendering with Altair
+    avoids the Plotly JS bundle and its per-rerun figure JSON payload.
+
+    Args:
+        predictions (dict): Dictionary with category predictions
+        threshold (float): Threshold for toxicity classification
+        title (str): Chart title
+
+    Returns:
+        altair.Chart: Bar chart with a threshold rule
+    """
+    import altair as alt
+
+    data = pd.DataFrame({
+        'category': list(predictions.keys()),
+        'score': list(predictions.values())
+    })
+
+    bars = alt.Chart(data).mark_bar().encode(
+        x=alt.X('category:N', sort=None, title='Toxicity Categories'),
+        y=alt.Y('score:Q',
+                scale=alt.Scale(domain=[0, 1]),
+                axis=alt.Axis(format='.0%'),
+                title='Confidence Score'),
+        color=alt.condition(alt.datum.score >= threshold,
+                            alt.value('red'), alt.value('green')),
+        tooltip=['category:N', alt.Tooltip('score:Q', format='.3f')]
+    )
+
+    rule = alt.Chart(pd.DataFrame({'threshold': [threshold]})).mark_rule(
+        strokeDash=[4, 4], color='orange'
+    ).encode(y='threshold:Q')
+
+    return (bars + rule).properties(title=title, height=400)
+
 def create_comparison_chart(predictions_list, labels, title="Toxicity Comparison"):
     """
     Create a comparison chart for multiple predictions.
@@ -137,16 +283,22 @@ def create_comparison_chart(predictions_list, labels, title="Toxicity Comparison
 
     fig = go.Figure()
 
-    colors = px.colors.qualitative.Set3[:len(predictions_list)]
+    colors = qualitative.Set3[:len(predictions_list)]
 
-    for i, (predictions, label) in enumerate(zip(predictions_list, labels)):
-        scores = [predictions[cat] for cat in categories]
+    # Stack all predictions into one (n_models, n_categories) array up
+    # front; the trace loop then just slices rows instead of repeating
+    # per-category dict lookups for every model
+    score_matrix = np.array(
+        [[predictions[cat] for cat in categories] for predictions in predictions_list],
+        dtype=float
+    )
 
+    for i, label in enumerate(labels):
         fig.add_trace(go.Bar(
             name=label,
             x=categories,
-            y=scores,
-            text=[f'{score:.1%}' for score in scores],
+            y=score_matrix[i],
+            texttemplate='%{y:.1%}',
             textposition='auto',
             marker_color=colors[i],
             hovertemplate=f'<b>{label}</b><br>%{{x}}: %{{y:.3f}}<extra></extra>'
@@ -191,7 +343,7 @@ def create_time_series_chart(data, title="Toxicity Over Time"):
 
     # Add traces for each toxicity category
     toxicity_categories = ['toxic', 'severe_toxic', 'obscene', 'threat', 'insult', 'identity_hate']
-    colors = px.colors.qualitative.Set1
+    colors = qualitative.Set1
 
     for i, category in enumerate(toxicity_categories):
         if category in data.columns:
@@ -199,7 +351,7 @@ def create_time_series_chart(data, title="Toxicity Over Time"):
                 x=data['timestamp'],
                 y=data[category],
                 mode='lines+markers',
-                name=category.replace('_', ' ').title(),
+                name=_display_name(category),
                 line=dict(color=colors[i % len(colors)]),
                 hovertemplate=f'<b>{category.title()}</b><br>Time: %{{x}}<br>Score: %{{y:.3f}}<extra></extra>'
             ))
@@ -235,19 +387,12 @@ def create_word_cloud_data(text, max_words=50):
     if not isinstance(text, str):
         text = str(text)
 
-    # Simple word frequency calculation
-    words = text.lower().split()
-    word_freq = {}
-
-    for word in words:
-        # Basic cleaning
-        word = word.strip('.,!?";:()[]{}')
-        if len(word) > 2:  # Skip very short words
-            word_freq[word] = word_freq.get(word, 0) + 1
+    # Strip punctuation once with translate, then count in C
+    cleaned = text.lower().translate(_WORDCLOUD_TRANS)
+    word_freq = Counter(word for word in cleaned.split() if len(word) > 2)
 
-    # Sort by frequency and limit
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    return dict(sorted_words[:max_words])
+    # most_common uses a top-k heap instead of sorting every entry
+    return dict(word_freq.most_common(max_words))
 
 def create_distribution_chart(scores, title="Score Distribution"):
     """